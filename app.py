@@ -1,6 +1,7 @@
 import sqlite3
-from functools import wraps
+from functools import lru_cache, wraps
 import json
+import logging
 
 from flask import Flask, request, jsonify, render_template
 from flask_cors import CORS
@@ -9,10 +10,13 @@ import re
 import os
 import jwt
 import datetime
+import threading
+import time
 from datetime import timezone
 
 # --- Configuration ---
 app = Flask(__name__, static_folder='static', static_url_path='/static')
+logger = logging.getLogger(__name__)
 # Enable CORS so browser-based frontends (like index.html) can POST to /api/register
 CORS(app, resources={r"/api/*": {"origins": "*"}})
 # Use an absolute path for the SQLite file (stable regardless of current working dir)
@@ -27,13 +31,26 @@ if not os.getenv("PYTEST_CURRENT_TEST"):
 # Secret used for signing JWTs. In production, set via environment variable.
 SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret")
 JWT_EXP_DELTA_SECONDS = int(os.getenv("JWT_EXP_DELTA_SECONDS", 3600))
+# werkzeug hashing method for new passwords; tests lower the work factor through app.config
+app.config["PASSWORD_HASH_METHOD"] = os.getenv("PASSWORD_HASH_METHOD", "scrypt")
+# How long a serialized /api/labs/available response may be reused. Opt-in (0 disables
+# caching): the cache is per process and only app writes invalidate it, so slots
+# changed directly in the database can be served stale for up to the TTL.
+AVAILABLE_LABS_CACHE_TTL = float(os.getenv("AVAILABLE_LABS_CACHE_TTL", 0))
+AVAILABLE_LABS_CACHE_MAXSIZE = 128
+# UPDATE ... RETURNING needs SQLite 3.35+
+SQLITE_SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
 
 # --- Database Setup ---
 
 
 def get_db_connection():
     """Connects to the SQLite database."""
-    conn = sqlite3.connect(DATABASE)
+    # A larger prepared-statement cache keeps the hot lab/booking queries
+    # compiled for the lifetime of the connection.
+    # "file:" URIs (e.g. file:name?mode=memory&cache=shared) let several connections
+    # share one in-memory database.
+    conn = sqlite3.connect(DATABASE, cached_statements=256, uri=DATABASE.startswith("file:"))
     conn.row_factory = sqlite3.Row  # This allows accessing columns by name
     return conn
 
@@ -77,6 +94,11 @@ def init_db():
         );
         """
     )
+    # Indexes for the booking lookups: a user's bookings, per-lab/date conflict
+    # checks and the pending/approved status filters
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_bookings_college ON bookings (college_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_bookings_lab_date ON bookings (lab_name, booking_date)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_bookings_status ON bookings (status)")
     # Create labs table for lab information
     cursor.execute(
         """
@@ -103,6 +125,22 @@ def init_db():
         );
         """
     )
+    # Covering index for the per-day slot lookup in /api/labs/available, so SQLite
+    # answers it from the index alone without touching the table rows
+    cursor.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_availability_slots_day_lab
+        ON availability_slots (day_of_week, lab_id, start_time, end_time);
+        """
+    )
+    # Lab-first covering index for per-lab slot checks when booking, the admin
+    # LEFT JOIN and lab deletes (including the ON DELETE CASCADE lookup)
+    cursor.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_availability_slots_lab_day
+        ON availability_slots (lab_id, day_of_week, start_time, end_time);
+        """
+    )
     # Create equipment_availability table for tracking individual equipment availability
     cursor.execute(
         """
@@ -167,15 +205,24 @@ def init_db():
 
 # --- Helper Functions for Availability ---
 
+_DAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+
+@lru_cache(maxsize=4096)
 def get_day_of_week(date_str):
     """
     Get the day of week name from a date string (YYYY-MM-DD).
     Returns: 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'
     """
     try:
-        date_obj = datetime.datetime.strptime(date_str, "%Y-%m-%d")
-        days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        return days[date_obj.weekday()]
+        # Fast path for canonical YYYY-MM-DD strings: slice the fields directly
+        # instead of running strptime's format tokenizer on every call.
+        if (len(date_str) == 10 and date_str[4] == date_str[7] == '-'
+                and (date_str[0:4] + date_str[5:7] + date_str[8:10]).isdigit()):
+            date_obj = datetime.date(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
+        else:
+            date_obj = datetime.datetime.strptime(date_str, "%Y-%m-%d")
+        return _DAYS[date_obj.weekday()]
     except ValueError:
         return None
 
@@ -183,6 +230,8 @@ def get_day_of_week(date_str):
 def time_to_minutes(time_str):
     """Convert time string (HH:MM) to minutes since midnight."""
     try:
+        if len(time_str) == 5 and time_str[2] == ':':
+            return int(time_str[0:2]) * 60 + int(time_str[3:5])
         parts = time_str.split(':')
         return int(parts[0]) * 60 + int(parts[1])
     except (ValueError, IndexError):
@@ -208,6 +257,12 @@ def slots_overlap(slot1_start, slot1_end, slot2_start, slot2_end):
 
 # --- Helper Functions (Core Logic) ---
 
+# Registration validation patterns, compiled once at import
+EMAIL_REGEX = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+PASSWORD_DIGIT_REGEX = re.compile(r"\d")
+PASSWORD_SYMBOL_REGEX = re.compile(r'[!@#$%^&*(),.?":{}|<>]')
+
+
 def validate_registration_data(data):
     """
     Validates the data against the user story security rules:
@@ -231,8 +286,7 @@ def validate_registration_data(data):
         errors.append(f"Invalid role. Must be one of: {', '.join(valid_roles)}.")
 
     # Email format validation
-    email_regex = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    if not re.match(email_regex, data["email"]):
+    if not EMAIL_REGEX.match(data["email"]):
         errors.append("Invalid email format.")
 
     password = data["password"]
@@ -240,9 +294,9 @@ def validate_registration_data(data):
     if len(password) < 8:
         errors.append("Password must be at least 8 characters long.")
     # Password complexity checks (1 number, 1 symbol)
-    if not re.search(r"\d", password):
+    if not PASSWORD_DIGIT_REGEX.search(password):
         errors.append("Password must contain at least one number.")
-    if not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
+    if not PASSWORD_SYMBOL_REGEX.search(password):
         errors.append("Password must contain at least one symbol (!@#$%^&*...).")
 
     return not errors, errors
@@ -258,7 +312,7 @@ def register_user(data):
         return False, "Validation failed: " + ", ".join(errors)
 
     # Hash the password for secure storage
-    hashed_password = generate_password_hash(data["password"])
+    hashed_password = generate_password_hash(data["password"], method=app.config["PASSWORD_HASH_METHOD"])
 
     conn = get_db_connection()
     try:
@@ -293,7 +347,7 @@ def register_user(data):
                 "Duplicate college ID validation error: This college ID is already registered.",
             )
         else:
-            print(f"Database Error: {e}")
+            logger.error("Database Error: %s", e)
             return False, "A database error occurred during registration."
     finally:
         # Only close the connection if it's not an in-memory database (testing uses :memory:)
@@ -487,7 +541,7 @@ def handle_login():
             "name": row["name"]
         }), 200
     except Exception as e:
-        print(f"Login error: {e}")
+        logger.error("Login error: %s", e)
         return jsonify({"message": "An error occurred during login.", "success": False}), 500
     finally:
         if DATABASE != ":memory:":
@@ -647,14 +701,10 @@ def create_booking():
             "success": True
         }), 201
     except sqlite3.Error as e:
-        print(f"Database Error in create_booking: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Database Error in create_booking: %s", e)
         return jsonify({"message": "Failed to create booking.", "success": False}), 500
     except Exception as e:
-        print(f"Unexpected error in create_booking: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Unexpected error in create_booking: %s", e)
         return jsonify({"message": "An unexpected error occurred.", "success": False}), 500
     finally:
         if DATABASE != ":memory:":
@@ -766,10 +816,10 @@ def check_booking_availability():
             "success": True
         }), 200
     except sqlite3.Error as e:
-        print(f"Database error in check_booking_availability: {e}")
+        logger.error("Database error in check_booking_availability: %s", e)
         return jsonify({"message": "Database error occurred.", "success": False}), 500
     except Exception as e:
-        print(f"Unexpected error in check_booking_availability: {e}")
+        logger.error("Unexpected error in check_booking_availability: %s", e)
         return jsonify({"message": "An unexpected error occurred.", "success": False}), 500
     finally:
         if DATABASE != ":memory:":
@@ -816,9 +866,8 @@ def get_bookings():
                 (college_id,),
             )
 
-        rows = cursor.fetchall()
         bookings = []
-        for row in rows:
+        for row in cursor:
             bookings.append({
                 "id": row["id"],
                 "college_id": row["college_id"],
@@ -835,14 +884,10 @@ def get_bookings():
 
         return jsonify({"bookings": bookings, "success": True}), 200
     except sqlite3.Error as e:
-        print(f"Database Error in get_bookings: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Database Error in get_bookings: %s", e)
         return jsonify({"message": "Failed to retrieve bookings.", "success": False, "error": str(e)}), 500
     except Exception as e:
-        print(f"Unexpected error in get_bookings: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Unexpected error in get_bookings: %s", e)
         return jsonify({"message": "An unexpected error occurred.", "success": False, "error": str(e)}), 500
     finally:
         if DATABASE != ":memory:":
@@ -872,9 +917,8 @@ def get_pending_bookings():
             ORDER BY b.created_at DESC
             """
         )
-        rows = cursor.fetchall()
         bookings = []
-        for row in rows:
+        for row in cursor:
             bookings.append({
                 "id": row["id"],
                 "college_id": row["college_id"],
@@ -890,14 +934,10 @@ def get_pending_bookings():
 
         return jsonify({"bookings": bookings, "success": True}), 200
     except sqlite3.Error as e:
-        print(f"Database Error in get_pending_bookings: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Database Error in get_pending_bookings: %s", e)
         return jsonify({"message": "Failed to retrieve pending bookings.", "success": False}), 500
     except Exception as e:
-        print(f"Unexpected error in get_pending_bookings: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Unexpected error in get_pending_bookings: %s", e)
         return jsonify({"message": "An unexpected error occurred.", "success": False}), 500
     finally:
         if DATABASE != ":memory:":
@@ -934,6 +974,7 @@ def approve_booking(booking_id):
             (updated_at, booking_id),
         )
         conn.commit()
+        invalidate_availability()
 
         # Get user email for notification (for future email sending)
         cursor.execute(
@@ -947,14 +988,10 @@ def approve_booking(booking_id):
             "success": True
         }), 200
     except sqlite3.Error as e:
-        print(f"Database Error in approve_booking: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Database Error in approve_booking: %s", e)
         return jsonify({"message": "Failed to approve booking.", "success": False}), 500
     except Exception as e:
-        print(f"Unexpected error in approve_booking: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Unexpected error in approve_booking: %s", e)
         return jsonify({"message": "An unexpected error occurred.", "success": False}), 500
     finally:
         if DATABASE != ":memory:":
@@ -991,20 +1028,17 @@ def reject_booking(booking_id):
             (updated_at, booking_id),
         )
         conn.commit()
+        invalidate_availability()
 
         return jsonify({
             "message": "Booking rejected successfully.",
             "success": True
         }), 200
     except sqlite3.Error as e:
-        print(f"Database Error in reject_booking: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Database Error in reject_booking: %s", e)
         return jsonify({"message": "Failed to reject booking.", "success": False}), 500
     except Exception as e:
-        print(f"Unexpected error in reject_booking: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Unexpected error in reject_booking: %s", e)
         return jsonify({"message": "An unexpected error occurred.", "success": False}), 500
     finally:
         if DATABASE != ":memory:":
@@ -1013,6 +1047,26 @@ def reject_booking(booking_id):
 
 # --- Admin Lab Availability Endpoint ---
 
+# Hot read queries are kept as module-level constants so every request
+# submits identical SQL text and hits the connection's statement cache.
+ADMIN_LABS_WITH_SLOTS_QUERY = """
+    SELECT l.id, l.name, l.capacity, l.equipment,
+           av.start_time, av.end_time
+    FROM labs l
+    LEFT JOIN availability_slots av ON l.id = av.lab_id AND av.day_of_week = ?
+    ORDER BY l.name ASC, av.start_time ASC
+"""
+
+ADMIN_BOOKINGS_FOR_DATE_QUERY = """
+    SELECT b.id, b.college_id, b.lab_name, b.start_time, b.end_time,
+           b.status, b.created_at, u.name, u.email
+    FROM bookings b
+    LEFT JOIN users u ON b.college_id = u.college_id
+    WHERE b.booking_date = ?
+    ORDER BY b.lab_name ASC, b.start_time ASC
+"""
+
+
 @app.route("/api/admin/labs/available", methods=["GET"])
 @require_role("admin")
 def admin_get_available_labs():
@@ -1055,33 +1109,14 @@ def admin_get_available_labs():
             cursor = conn.cursor()
 
         # Fetch all labs with their availability slots for this day
-        labs_query = (
-            """
-            SELECT l.id, l.name, l.capacity, l.equipment,
-                   av.start_time, av.end_time
-            FROM labs l
-            LEFT JOIN availability_slots av ON l.id = av.lab_id AND av.day_of_week = ?
-            ORDER BY l.name ASC, av.start_time ASC
-            """
-        )
-        cursor.execute(labs_query, (day_of_week,))
+        cursor.execute(ADMIN_LABS_WITH_SLOTS_QUERY, (day_of_week,))
         labs_rows = cursor.fetchall()
 
         # Fetch all bookings for this lab on this date (check if bookings table exists)
         bookings_rows = []
         cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='bookings'")
         if cursor.fetchone():
-            bookings_query = (
-                """
-                SELECT b.id, b.college_id, b.lab_name, b.start_time, b.end_time,
-                       b.status, b.created_at, u.name, u.email
-                FROM bookings b
-                LEFT JOIN users u ON b.college_id = u.college_id
-                WHERE b.booking_date = ?
-                ORDER BY b.lab_name ASC, b.start_time ASC
-                """
-            )
-            cursor.execute(bookings_query, (date_str,))
+            cursor.execute(ADMIN_BOOKINGS_FOR_DATE_QUERY, (date_str,))
             bookings_rows = cursor.fetchall()
 
         # Build labs dictionary with slots
@@ -1119,6 +1154,11 @@ def admin_get_available_labs():
                             "capacity": row[2]
                         }
 
+        # Labs come back in name order from SQL; index them by name once for the booking lookup
+        lab_ids_by_name = {}
+        for lid, ldata in labs_dict.items():
+            lab_ids_by_name.setdefault(ldata["lab_name"], lid)
+
         # Process bookings and match them to slots
         for booking_row in bookings_rows:
             booking_id = booking_row[0]
@@ -1132,11 +1172,7 @@ def admin_get_available_labs():
             booking_user_email = booking_row[8]
 
             # Find the lab by name
-            lab_id = None
-            for lid, ldata in labs_dict.items():
-                if ldata["lab_name"] == lab_name:
-                    lab_id = lid
-                    break
+            lab_id = lab_ids_by_name.get(lab_name)
 
             if lab_id:
                 booking = {
@@ -1309,15 +1345,68 @@ def admin_get_available_labs():
             "total_labs": len(labs)
         }), 200
     except sqlite3.Error as e:
-        print(f"Database Error in admin_get_available_labs: {e}")
+        logger.error("Database Error in admin_get_available_labs: %s", e)
         return jsonify({"error": "Something went wrong"}), 500
     finally:
         if DATABASE != ":memory:":
             conn.close()
 
 
+# --- Available Labs Response Cache ---
+
+_available_labs_cache = {}
+_available_labs_cache_lock = threading.Lock()
+
+
+def _get_cached_available_labs(key):
+    """Return the cached response body for key, or None if missing/expired."""
+    with _available_labs_cache_lock:
+        entry = _available_labs_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, body = entry
+        if expires_at <= time.monotonic():
+            del _available_labs_cache[key]
+            return None
+        return body
+
+
+def _store_available_labs(key, body):
+    """Cache a serialized /api/labs/available response body."""
+    if AVAILABLE_LABS_CACHE_TTL <= 0:
+        return
+    with _available_labs_cache_lock:
+        if len(_available_labs_cache) >= AVAILABLE_LABS_CACHE_MAXSIZE:
+            _available_labs_cache.clear()
+        _available_labs_cache[key] = (time.monotonic() + AVAILABLE_LABS_CACHE_TTL, body)
+
+
+def invalidate_availability():
+    """Drop all cached /api/labs/available responses (call after lab/booking writes)."""
+    with _available_labs_cache_lock:
+        _available_labs_cache.clear()
+
+
 # --- Unified Lab Availability Endpoint (All Roles) ---
 
+LABS_ORDERED_QUERY = "SELECT id, name, capacity, equipment FROM labs ORDER BY name ASC"
+
+SLOTS_FOR_DAY_QUERY = """
+    SELECT lab_id, start_time, end_time
+    FROM availability_slots
+    WHERE day_of_week = ?
+"""
+
+APPROVED_BOOKINGS_FOR_DATE_QUERY = """
+    SELECT b.id, b.college_id, b.lab_name, b.start_time, b.end_time,
+           b.created_at, u.name as user_name
+    FROM bookings b
+    LEFT JOIN users u ON b.college_id = u.college_id
+    WHERE b.booking_date = ? AND b.status = 'approved'
+    ORDER BY b.lab_name ASC, b.start_time ASC
+"""
+
+
 @app.route("/api/labs/available", methods=["GET"])
 @require_auth
 def get_available_labs():
@@ -1356,6 +1445,15 @@ def get_available_labs():
 
     is_admin = user_role == 'admin'
 
+    # Get day of week for availability slots
+    day_of_week = get_day_of_week(date_str)
+
+    # The response only depends on the date and whether the caller is an admin
+    cache_key = (date_str, day_of_week, is_admin)
+    cached_body = _get_cached_available_labs(cache_key)
+    if cached_body is not None:
+        return app.response_class(cached_body, status=200, mimetype="application/json")
+
     conn = get_db_connection()
     try:
         cursor = conn.cursor()
@@ -1368,27 +1466,16 @@ def get_available_labs():
             conn = get_db_connection()  # Get fresh connection after init
             cursor = conn.cursor()
 
-        # Get day of week for availability slots
-        day_of_week = get_day_of_week(date_str)
-
         # Get all labs
-        cursor.execute("SELECT id, name, capacity, equipment FROM labs ORDER BY name ASC")
+        cursor.execute(LABS_ORDERED_QUERY)
         labs_rows = cursor.fetchall()
 
         # Get availability slots for the day (check if availability_slots table exists)
         slots_by_lab = {}
         cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='availability_slots'")
         if cursor.fetchone() and day_of_week:
-            cursor.execute(
-                """
-                SELECT lab_id, start_time, end_time
-                FROM availability_slots
-                WHERE day_of_week = ?
-                """,
-                (day_of_week,)
-            )
-            slots_rows = cursor.fetchall()
-            for row in slots_rows:
+            cursor.execute(SLOTS_FOR_DAY_QUERY, (day_of_week,))
+            for row in cursor:
                 lab_id = row[0]
                 if lab_id not in slots_by_lab:
                     slots_by_lab[lab_id] = []
@@ -1401,17 +1488,7 @@ def get_available_labs():
         bookings_rows = []
         cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='bookings'")
         if cursor.fetchone():
-            cursor.execute(
-                """
-                SELECT b.id, b.college_id, b.lab_name, b.start_time, b.end_time,
-                       b.created_at, u.name as user_name
-                FROM bookings b
-                LEFT JOIN users u ON b.college_id = u.college_id
-                WHERE b.booking_date = ? AND b.status = 'approved'
-                ORDER BY b.lab_name ASC, b.start_time ASC
-                """,
-                (date_str,)
-            )
+            cursor.execute(APPROVED_BOOKINGS_FOR_DATE_QUERY, (date_str,))
             bookings_rows = cursor.fetchall()
 
         # Get disabled labs for the date (check if disabled_labs table exists)
@@ -1422,7 +1499,7 @@ def get_available_labs():
                 "SELECT lab_id, reason FROM disabled_labs WHERE disabled_date = ?",
                 (date_str,)
             )
-            disabled_labs = {row[0]: row[1] for row in cursor.fetchall()}
+            disabled_labs = {row[0]: row[1] for row in cursor}
 
         # Organize bookings by lab name
         bookings_by_lab = {}
@@ -1545,22 +1622,20 @@ def get_available_labs():
                 if is_admin or lab_id not in disabled_labs:
                     labs.append(lab_data)
 
-        return jsonify({
+        response = jsonify({
             "date": date_str,
             "labs": labs,
             "total_labs": len(labs),
             "success": True
-        }), 200
+        })
+        _store_available_labs(cache_key, response.get_data())
+        return response, 200
 
     except sqlite3.Error as e:
-        print(f"Database Error in get_available_labs: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Database Error in get_available_labs: %s", e)
         return jsonify({"error": "Database error occurred", "details": str(e)}), 500
     except Exception as e:
-        print(f"Unexpected Error in get_available_labs: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Unexpected Error in get_available_labs: %s", e)
         return jsonify({"error": "An unexpected error occurred", "details": str(e)}), 500
     finally:
         if DATABASE != ":memory:":
@@ -1569,60 +1644,116 @@ def get_available_labs():
 
 # --- Lab Management Functions ---
 
+# Extended result code for a UNIQUE constraint failure
+SQLITE_CONSTRAINT_UNIQUE = 2067
+
+
+def is_unique_violation(error):
+    """
+    Return True if an IntegrityError was raised by a UNIQUE constraint.
+
+    Uses the extended SQLite error code (Python 3.11+) and falls back to the message
+    text when the code is unavailable, e.g. on older Pythons or hand-built errors.
+    """
+    error_code = getattr(error, "sqlite_errorcode", None)
+    if error_code is not None:
+        return error_code == SQLITE_CONSTRAINT_UNIQUE
+    return "UNIQUE constraint failed" in str(error)
+
+
+_iso_now_cache = (0, "")
+
+
+def _iso_now():
+    """
+    Return the current UTC time as an ISO string, truncated to the second.
+
+    The formatted string is reused for every call within the same second, which keeps
+    bursts of lab/equipment writes from building a new datetime for each row.
+    """
+    global _iso_now_cache
+    now = int(time.time())
+    cached_second, cached_iso = _iso_now_cache
+    if cached_second != now:
+        cached_iso = datetime.datetime.fromtimestamp(now, tz=timezone.utc).isoformat()
+        _iso_now_cache = (now, cached_iso)
+    return cached_iso
+
+
+EQUIPMENT_CSV_SPLIT_REGEX = re.compile(r"\s*,\s*")
+
+
+@lru_cache(maxsize=1024)
+def parse_equipment_list(equipment_str):
+    """
+    Parse a stored equipment string (JSON array or comma-separated) into a tuple of names.
+
+    Memoized because the same few equipment strings are parsed on every lab write
+    and equipment auto-initialization; callers must not rely on a mutable result.
+    """
+    # Only strings that look like JSON go through json.loads; plain comma-separated
+    # values skip straight to the split instead of raising JSONDecodeError first
+    parsed = equipment_str
+    if equipment_str.lstrip()[:1] in ('[', '{', '"'):
+        try:
+            parsed = json.loads(equipment_str)
+        except ValueError:
+            pass
+    if isinstance(parsed, str):
+        # One regex pass splits and strips the comma-separated names
+        return tuple(name for name in EQUIPMENT_CSV_SPLIT_REGEX.split(parsed.strip()) if name)
+    if not isinstance(parsed, list):
+        parsed = [equipment_str]
+    return tuple(e.strip() for e in parsed if isinstance(e, str) and e.strip())
+
+
+INSERT_EQUIPMENT_AVAILABILITY_QUERY = """
+    INSERT OR IGNORE INTO equipment_availability
+    (lab_id, equipment_name, is_available, created_at)
+    VALUES (?, ?, 'yes', ?)
+"""
+
 
 def initialize_equipment_availability(cursor, lab_id, equipment_list):
     """Initialize equipment availability entries for a lab."""
-    created_at = datetime.datetime.now(timezone.utc).isoformat()
-    for equipment_name in equipment_list:
-        try:
-            cursor.execute(
-                """
-                INSERT OR IGNORE INTO equipment_availability
-                (lab_id, equipment_name, is_available, created_at)
-                VALUES (?, ?, 'yes', ?)
-                """,
-                (lab_id, equipment_name.strip(), created_at),
-            )
-        except sqlite3.Error as e:
-            print(f"Error initializing equipment availability for {equipment_name}: {e}")
+    created_at = _iso_now()
+    try:
+        cursor.executemany(
+            INSERT_EQUIPMENT_AVAILABILITY_QUERY,
+            [(lab_id, equipment_name.strip(), created_at) for equipment_name in equipment_list],
+        )
+    except sqlite3.Error as e:
+        logger.error("Error initializing equipment availability for lab %s: %s", lab_id, e)
 
 
 def sync_equipment_availability(cursor, lab_id, equipment_list):
     """Sync equipment availability: add new, remove deleted, keep existing."""
-    created_at = datetime.datetime.now(timezone.utc).isoformat()
+    created_at = _iso_now()
 
     # Get current equipment names from availability table
     cursor.execute(
         "SELECT equipment_name FROM equipment_availability WHERE lab_id = ?",
         (lab_id,)
     )
-    existing_equipment = {row["equipment_name"] for row in cursor.fetchall()}
+    existing_equipment = {row["equipment_name"] for row in cursor}
 
     # Normalize new equipment list
     new_equipment = {eq.strip() for eq in equipment_list}
 
     # Add new equipment
-    for equipment_name in new_equipment:
-        if equipment_name not in existing_equipment:
-            try:
-                cursor.execute(
-                    """
-                    INSERT INTO equipment_availability
-                    (lab_id, equipment_name, is_available, created_at)
-                    VALUES (?, ?, 'yes', ?)
-                    """,
-                    (lab_id, equipment_name, created_at),
-                )
-            except sqlite3.Error as e:
-                print(f"Error adding equipment availability for {equipment_name}: {e}")
+    try:
+        cursor.executemany(
+            INSERT_EQUIPMENT_AVAILABILITY_QUERY,
+            [(lab_id, name, created_at) for name in new_equipment - existing_equipment],
+        )
+    except sqlite3.Error as e:
+        logger.error("Error adding equipment availability for lab %s: %s", lab_id, e)
 
     # Remove deleted equipment
-    for equipment_name in existing_equipment:
-        if equipment_name not in new_equipment:
-            cursor.execute(
-                "DELETE FROM equipment_availability WHERE lab_id = ? AND equipment_name = ?",
-                (lab_id, equipment_name)
-            )
+    cursor.executemany(
+        "DELETE FROM equipment_availability WHERE lab_id = ? AND equipment_name = ?",
+        [(lab_id, name) for name in existing_equipment - new_equipment],
+    )
 
 
 def validate_lab_data(data):
@@ -1724,7 +1855,7 @@ def create_lab():
         if isinstance(equipment, list):
             equipment = json.dumps(equipment)
 
-        created_at = datetime.datetime.now(timezone.utc).isoformat()
+        created_at = _iso_now()
         cursor.execute(
             """
             INSERT INTO labs (name, capacity, equipment, created_at)
@@ -1733,30 +1864,24 @@ def create_lab():
             (data["name"].strip(), int(data["capacity"]), equipment, created_at),
         )
         conn.commit()
+        invalidate_availability()
         lab_id = cursor.lastrowid
 
         # Initialize equipment availability
         try:
-            equipment_list = json.loads(equipment) if isinstance(equipment, str) else equipment
-            if isinstance(equipment_list, str):
-                # Try to parse as comma-separated
-                equipment_list = [e.strip() for e in equipment_list.split(',') if e.strip()]
-            if isinstance(equipment_list, list):
-                initialize_equipment_availability(cursor, lab_id, equipment_list)
-                conn.commit()
+            initialize_equipment_availability(cursor, lab_id, parse_equipment_list(equipment))
+            conn.commit()
         except Exception as e:
-            print(f"Warning: Could not initialize equipment availability: {e}")
+            logger.warning("Could not initialize equipment availability: %s", e)
 
-        # Get the created lab
-        cursor.execute("SELECT * FROM labs WHERE id = ?", (lab_id,))
-        lab_row = cursor.fetchone()
+        # Every column is already known locally, no need to read the row back
         lab_data = {
-            "id": lab_row["id"],
-            "name": lab_row["name"],
-            "capacity": lab_row["capacity"],
-            "equipment": lab_row["equipment"],
-            "created_at": lab_row["created_at"],
-            "updated_at": lab_row["updated_at"],
+            "id": lab_id,
+            "name": data["name"].strip(),
+            "capacity": int(data["capacity"]),
+            "equipment": equipment,
+            "created_at": created_at,
+            "updated_at": None,
         }
 
         return jsonify({
@@ -1765,27 +1890,41 @@ def create_lab():
             "success": True
         }), 201
     except sqlite3.IntegrityError as e:
-        if "UNIQUE constraint failed: labs.name" in str(e):
+        if is_unique_violation(e):
             return jsonify({"message": "A lab with this name already exists.", "success": False}), 400
-        print(f"Integrity Error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Integrity Error: %s", e)
         return jsonify({"message": "Failed to create lab.", "success": False}), 500
     except sqlite3.Error as e:
-        print(f"Database Error in create_lab: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Database Error in create_lab: %s", e)
         return jsonify({"message": "Failed to create lab.", "success": False}), 500
     except Exception as e:
-        print(f"Unexpected error in create_lab: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Unexpected error in create_lab: %s", e)
         return jsonify({"message": "An unexpected error occurred.", "success": False}), 500
     finally:
         if DATABASE != ":memory:":
             conn.close()
 
 
+LABS_MISSING_EQUIPMENT_AVAILABILITY_QUERY = """
+    SELECT l.id, l.equipment
+    FROM labs l
+    WHERE NOT EXISTS (SELECT 1 FROM equipment_availability ea WHERE ea.lab_id = l.id)
+"""
+
+LABS_WITH_TIMESTAMPS_QUERY = """
+    SELECT id, name, capacity, equipment, created_at, updated_at
+    FROM labs
+    ORDER BY name ASC
+"""
+
+# One pass over every lab's equipment; the outer ORDER BY fixes the per-lab order
+EQUIPMENT_AVAILABILITY_BY_LAB_QUERY = """
+    SELECT lab_id, equipment_name, is_available
+    FROM equipment_availability
+    ORDER BY lab_id, equipment_name ASC
+"""
+
+
 @app.route("/api/labs", methods=["GET"])
 @require_auth
 def get_labs():
@@ -1800,99 +1939,53 @@ def get_labs():
             # Table doesn't exist yet, return empty list
             return jsonify({"labs": [], "success": True}), 200
 
-        cursor.execute("SELECT * FROM labs ORDER BY name ASC")
-        rows = cursor.fetchall()
-        labs = []
-        for row in rows:
-            lab_id = row["id"]
-            # Get equipment availability for this lab
-            cursor.execute(
-                """
-                SELECT equipment_name, is_available
-                FROM equipment_availability
-                WHERE lab_id = ?
-                ORDER BY equipment_name ASC
-                """,
-                (lab_id,)
-            )
-            equipment_availability = []
-            for eq_row in cursor.fetchall():
-                equipment_availability.append({
-                    "equipment_name": eq_row["equipment_name"],
-                    "is_available": eq_row["is_available"]
-                })
-
-            # Auto-initialize equipment availability if missing (for existing labs)
-            if len(equipment_availability) == 0:
-                try:
-                    equipment_str = row["equipment"]
-                    equipment_list = []
-                    try:
-                        equipment_list = json.loads(equipment_str)
-                        if not isinstance(equipment_list, list):
-                            equipment_list = [equipment_str]
-                    except (json.JSONDecodeError, ValueError):
-                        if ',' in equipment_str:
-                            equipment_list = [e.strip() for e in equipment_str.split(',') if e.strip()]
-                        else:
-                            equipment_list = [equipment_str.strip()] if equipment_str.strip() else []
-
-                    if equipment_list:
-                        created_at = datetime.datetime.now(timezone.utc).isoformat()
-                        for equipment_name in equipment_list:
-                            if equipment_name and equipment_name.strip():
-                                try:
-                                    cursor.execute(
-                                        """
-                                        INSERT OR IGNORE INTO equipment_availability
-                                        (lab_id, equipment_name, is_available, created_at)
-                                        VALUES (?, ?, 'yes', ?)
-                                        """,
-                                        (lab_id, equipment_name.strip(), created_at),
-                                    )
-                                except sqlite3.Error:
-                                    pass
-                        conn.commit()
-
-                        # Re-fetch equipment availability
-                        cursor.execute(
-                            """
-                            SELECT equipment_name, is_available
-                            FROM equipment_availability
-                            WHERE lab_id = ?
-                            ORDER BY equipment_name ASC
-                            """,
-                            (lab_id,)
-                        )
-                        equipment_availability = []
-                        for eq_row in cursor.fetchall():
-                            equipment_availability.append({
-                                "equipment_name": eq_row["equipment_name"],
-                                "is_available": eq_row["is_available"]
-                            })
-                except Exception as e:
-                    print(f"Warning: Could not auto-initialize equipment availability for lab {lab_id}: {e}")
+        # Auto-initialize equipment availability for labs that have none yet (for existing labs)
+        # All missing rows go in with one executemany and one commit
+        # Only id and equipment are read, so plain tuples are enough here
+        backfill_cursor = conn.cursor()
+        backfill_cursor.row_factory = None
+        backfill_cursor.execute(LABS_MISSING_EQUIPMENT_AVAILABILITY_QUERY)
+        created_at = _iso_now()
+        missing_rows = [
+            (lab_id, equipment_name, created_at)
+            for lab_id, equipment_str in backfill_cursor
+            for equipment_name in parse_equipment_list(equipment_str)
+        ]
+        if missing_rows:
+            try:
+                cursor.executemany(INSERT_EQUIPMENT_AVAILABILITY_QUERY, missing_rows)
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.warning("Could not auto-initialize equipment availability: %s", e)
+
+        # Two ordered queries instead of one equipment query per lab
+        equipment_by_lab = {}
+        cursor.execute(EQUIPMENT_AVAILABILITY_BY_LAB_QUERY)
+        for eq_row in cursor.fetchall():
+            equipment_by_lab.setdefault(eq_row["lab_id"], []).append({
+                "equipment_name": eq_row["equipment_name"],
+                "is_available": eq_row["is_available"]
+            })
 
-            labs.append({
+        cursor.execute(LABS_WITH_TIMESTAMPS_QUERY)
+        labs = [
+            {
                 "id": row["id"],
                 "name": row["name"],
                 "capacity": row["capacity"],
                 "equipment": row["equipment"],
-                "equipment_availability": equipment_availability,
+                "equipment_availability": equipment_by_lab.get(row["id"], []),
                 "created_at": row["created_at"],
                 "updated_at": row["updated_at"] if row["updated_at"] else None,
-            })
-
+            }
+            for row in cursor.fetchall()
+        ]
         return jsonify({"labs": labs, "success": True}), 200
     except sqlite3.Error as e:
-        print(f"Database Error in get_labs: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Database Error in get_labs: %s", e)
         return jsonify({"message": "Failed to retrieve labs.", "error": str(e), "success": False}), 500
     except Exception as e:
-        print(f"Unexpected error in get_labs: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Unexpected error in get_labs: %s", e)
         return jsonify({"message": "An unexpected error occurred.", "success": False}), 500
     finally:
         if DATABASE != ":memory:":
@@ -1929,20 +2022,19 @@ def get_lab(lab_id):
 
         return jsonify({"lab": lab_data, "success": True}), 200
     except sqlite3.Error as e:
-        print(f"Database Error in get_lab: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Database Error in get_lab: %s", e)
         return jsonify({"message": "Failed to retrieve lab.", "success": False}), 500
     except Exception as e:
-        print(f"Unexpected error in get_lab: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Unexpected error in get_lab: %s", e)
         return jsonify({"message": "An unexpected error occurred.", "success": False}), 500
     finally:
         if DATABASE != ":memory:":
             conn.close()
 
 
+UPDATE_LAB_QUERY = "UPDATE labs SET name = ?, capacity = ?, equipment = ?, updated_at = ? WHERE id = ?"
+
+
 @app.route("/api/labs/<int:lab_id>", methods=["PUT"])
 @require_role("admin")
 def update_lab(lab_id):
@@ -1963,48 +2055,42 @@ def update_lab(lab_id):
         if not cursor.fetchone():
             return jsonify({"message": "Labs table does not exist.", "success": False}), 404
 
-        # Check if lab exists
-        cursor.execute("SELECT id FROM labs WHERE id = ?", (lab_id,))
-        if not cursor.fetchone():
-            return jsonify({"message": "Lab not found.", "success": False}), 404
-
         # Parse equipment to JSON string if it's a list
         equipment = data["equipment"]
         if isinstance(equipment, list):
             equipment = json.dumps(equipment)
 
-        updated_at = datetime.datetime.now(timezone.utc).isoformat()
-        cursor.execute(
-            """
-            UPDATE labs SET name = ?, capacity = ?, equipment = ?, updated_at = ?
-            WHERE id = ?
-            """,
-            (data["name"].strip(), int(data["capacity"]), equipment, updated_at, lab_id),
-        )
+        updated_at = _iso_now()
+        update_params = (data["name"].strip(), int(data["capacity"]), equipment, updated_at, lab_id)
+        # The update doubles as the existence check; created_at is kept for the response body
+        if SQLITE_SUPPORTS_RETURNING:
+            cursor.execute(UPDATE_LAB_QUERY + " RETURNING created_at", update_params)
+            existing_lab = cursor.fetchone()
+        else:
+            cursor.execute(UPDATE_LAB_QUERY, update_params)
+            cursor.execute("SELECT created_at FROM labs WHERE id = ?", (lab_id,))
+            existing_lab = cursor.fetchone()
+        if not existing_lab:
+            return jsonify({"message": "Lab not found.", "success": False}), 404
+        created_at = existing_lab["created_at"]
         conn.commit()
+        invalidate_availability()
 
         # Sync equipment availability
         try:
-            equipment_list = json.loads(equipment) if isinstance(equipment, str) else equipment
-            if isinstance(equipment_list, str):
-                # Try to parse as comma-separated
-                equipment_list = [e.strip() for e in equipment_list.split(',') if e.strip()]
-            if isinstance(equipment_list, list):
-                sync_equipment_availability(cursor, lab_id, equipment_list)
-                conn.commit()
+            sync_equipment_availability(cursor, lab_id, parse_equipment_list(equipment))
+            conn.commit()
         except Exception as e:
-            print(f"Warning: Could not sync equipment availability: {e}")
+            logger.warning("Could not sync equipment availability: %s", e)
 
-        # Get the updated lab
-        cursor.execute("SELECT * FROM labs WHERE id = ?", (lab_id,))
-        lab_row = cursor.fetchone()
+        # Every column is already known locally, no need to read the row back
         lab_data = {
-            "id": lab_row["id"],
-            "name": lab_row["name"],
-            "capacity": lab_row["capacity"],
-            "equipment": lab_row["equipment"],
-            "created_at": lab_row["created_at"],
-            "updated_at": lab_row["updated_at"],
+            "id": lab_id,
+            "name": data["name"].strip(),
+            "capacity": int(data["capacity"]),
+            "equipment": equipment,
+            "created_at": created_at,
+            "updated_at": updated_at,
         }
 
         return jsonify({
@@ -2013,21 +2099,15 @@ def update_lab(lab_id):
             "success": True
         }), 200
     except sqlite3.IntegrityError as e:
-        if "UNIQUE constraint failed: labs.name" in str(e):
+        if is_unique_violation(e):
             return jsonify({"message": "A lab with this name already exists.", "success": False}), 400
-        print(f"Integrity Error in update_lab: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Integrity Error in update_lab: %s", e)
         return jsonify({"message": "Failed to update lab.", "success": False}), 500
     except sqlite3.Error as e:
-        print(f"Database Error in update_lab: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Database Error in update_lab: %s", e)
         return jsonify({"message": "Failed to update lab.", "success": False}), 500
     except Exception as e:
-        print(f"Unexpected error in update_lab: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Unexpected error in update_lab: %s", e)
         return jsonify({"message": "An unexpected error occurred.", "success": False}), 500
     finally:
         if DATABASE != ":memory:":
@@ -2061,20 +2141,17 @@ def delete_lab(lab_id):
         # Delete the lab
         cursor.execute("DELETE FROM labs WHERE id = ?", (lab_id,))
         conn.commit()
+        invalidate_availability()
 
         return jsonify({
             "message": f"Lab '{lab_name}' deleted successfully along with its availability slots.",
             "success": True
         }), 200
     except sqlite3.Error as e:
-        print(f"Database Error in delete_lab: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Database Error in delete_lab: %s", e)
         return jsonify({"message": "Failed to delete lab.", "success": False}), 500
     except Exception as e:
-        print(f"Unexpected error in delete_lab: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Unexpected error in delete_lab: %s", e)
         return jsonify({"message": "An unexpected error occurred.", "success": False}), 500
     finally:
         if DATABASE != ":memory:":
@@ -2143,14 +2220,10 @@ def update_equipment_availability(lab_id, equipment_name):
             "success": True
         }), 200
     except sqlite3.Error as e:
-        print(f"Database Error in update_equipment_availability: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Database Error in update_equipment_availability: %s", e)
         return jsonify({"message": "Failed to update equipment availability.", "success": False}), 500
     except Exception as e:
-        print(f"Unexpected error in update_equipment_availability: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Unexpected error in update_equipment_availability: %s", e)
         return jsonify({"message": "An unexpected error occurred.", "success": False}), 500
     finally:
         if DATABASE != ":memory:":
@@ -2185,20 +2258,17 @@ def override_booking(booking_id):
             (updated_at, booking_id)
         )
         conn.commit()
+        invalidate_availability()
 
         return jsonify({
             "message": "Booking cancelled successfully.",
             "success": True
         }), 200
     except sqlite3.Error as e:
-        print(f"Database Error in override_booking: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Database Error in override_booking: %s", e)
         return jsonify({"message": "Failed to override booking.", "success": False}), 500
     except Exception as e:
-        print(f"Unexpected error in override_booking: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Unexpected error in override_booking: %s", e)
         return jsonify({"message": "An unexpected error occurred.", "success": False}), 500
     finally:
         if DATABASE != ":memory:":
@@ -2273,20 +2343,17 @@ def disable_lab(lab_id):
             (lab_id, date_str, reason, created_at)
         )
         conn.commit()
+        invalidate_availability()
 
         return jsonify({
             "message": "Lab disabled successfully for the specified date.",
             "success": True
         }), 200
     except sqlite3.Error as e:
-        print(f"Database Error in disable_lab: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Database Error in disable_lab: %s", e)
         return jsonify({"message": "Failed to disable lab.", "success": False}), 500
     except Exception as e:
-        print(f"Unexpected error in disable_lab: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Unexpected error in disable_lab: %s", e)
         return jsonify({"message": "An unexpected error occurred.", "success": False}), 500
     finally:
         if DATABASE != ":memory:":
@@ -2367,9 +2434,8 @@ def get_assigned_labs():
             """,
             (day_of_week,)
         )
-        slots_rows = cursor.fetchall()
         slots_by_lab = {}
-        for row in slots_rows:
+        for row in cursor:
             lab_id = row[0]
             if lab_id not in slots_by_lab:
                 slots_by_lab[lab_id] = []
@@ -2437,14 +2503,10 @@ def get_assigned_labs():
             "total_assigned": len(assigned_labs)
         }), 200
     except sqlite3.Error as e:
-        print(f"Database Error in get_assigned_labs: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Database Error in get_assigned_labs: %s", e)
         return jsonify({"error": "Database error occurred", "details": str(e)}), 500
     except Exception as e:
-        print(f"Unexpected Error in get_assigned_labs: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Unexpected Error in get_assigned_labs: %s", e)
         return jsonify({"error": "An unexpected error occurred", "details": str(e)}), 500
     finally:
         if DATABASE != ":memory:":
@@ -2458,4 +2520,5 @@ init_db()
 if __name__ == "__main__":
     # Use environment variable for debug mode (default: False for security)
     debug_mode = os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
+    logging.basicConfig(level=logging.DEBUG if debug_mode else logging.INFO)
     app.run(debug=debug_mode, port=5000)
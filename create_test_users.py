@@ -44,43 +44,74 @@ test_users = [
 ]
 
 def create_test_users():
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+    # Autocommit mode so the script controls the single transaction explicitly
+    conn = sqlite3.connect(DB_PATH, isolation_level=None)
     
-    # Ensure users table exists
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS users (
-            college_id TEXT PRIMARY KEY NOT NULL,
-            name TEXT NOT NULL,
-            email TEXT UNIQUE NOT NULL,
-            password_hash TEXT NOT NULL,
-            role TEXT NOT NULL
-        );
-    """)
-    
-    created = 0
-    skipped = 0
-    
-    for user in test_users:
-        try:
-            password_hash = generate_password_hash(user["password"])
-            cursor.execute("""
-                INSERT INTO users (college_id, name, email, password_hash, role)
-                VALUES (?, ?, ?, ?, ?)
-            """, (
+    # Table setup, lookup and inserts share one transaction; the with block
+    # commits once on success and rolls back on error
+    with conn:
+        conn.execute("BEGIN")
+        cursor = conn.cursor()
+        
+        # Ensure users table exists
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS users (
+                college_id TEXT PRIMARY KEY NOT NULL,
+                name TEXT NOT NULL,
+                email TEXT UNIQUE NOT NULL,
+                password_hash TEXT NOT NULL,
+                role TEXT NOT NULL
+            );
+        """)
+        
+        # Find the test users that already exist with one query, so only the
+        # missing ones are hashed and inserted
+        placeholders = ", ".join("?" for _ in test_users)
+        cursor.execute(
+            f"SELECT college_id FROM users WHERE college_id IN ({placeholders})",
+            [user["college_id"] for user in test_users]
+        )
+        existing_ids = {row[0] for row in cursor.fetchall()}
+        
+        rows = []
+        for user in test_users:
+            if user["college_id"] in existing_ids:
+                print(f"[SKIP] User {user['college_id']} already exists, skipping...")
+                continue
+            rows.append((
                 user["college_id"],
                 user["name"],
                 user["email"],
-                password_hash,
+                generate_password_hash(user["password"]),
                 user["role"]
             ))
-            created += 1
+        
+        # Insert every new user in a single statement batch
+        cursor.executemany("""
+            INSERT OR IGNORE INTO users (college_id, name, email, password_hash, role)
+            VALUES (?, ?, ?, ?, ?)
+        """, rows)
+        
+        # OR IGNORE silently drops rows that clash on email, so report from what
+        # is actually in the table rather than from what was attempted
+        attempted_ids = [row[0] for row in rows]
+        inserted_ids = set()
+        if attempted_ids:
+            placeholders = ", ".join("?" for _ in attempted_ids)
+            cursor.execute(
+                f"SELECT college_id FROM users WHERE college_id IN ({placeholders})",
+                attempted_ids
+            )
+            inserted_ids = {row[0] for row in cursor.fetchall()}
+    
+    for user in test_users:
+        if user["college_id"] in inserted_ids:
             print(f"[OK] Created user: {user['college_id']} ({user['role']})")
-        except sqlite3.IntegrityError:
-            skipped += 1
-            print(f"[SKIP] User {user['college_id']} already exists, skipping...")
+        elif user["college_id"] in attempted_ids:
+            print(f"[SKIP] User {user['college_id']} not created: email {user['email']} is already in use")
     
-    conn.commit()
+    created = len(inserted_ids)
+    skipped = len(test_users) - created
     conn.close()
     
     print(f"\n[SUMMARY] {created} users created, {skipped} skipped")
@@ -0,0 +1,225 @@
+import datetime
+import sqlite3
+from functools import lru_cache
+
+import pytest
+from werkzeug.security import generate_password_hash
+
+import app as app_module
+
+
+# One PBKDF2 round: insecure, but the tests only need hashes check_password_hash accepts
+TEST_PASSWORD_HASH_METHOD = "pbkdf2:sha256:1"
+
+# Filler for NOT NULL created_at columns; no test asserts on the value
+CREATED_AT = "2025-01-15T10:00:00+00:00"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def testing_app():
+    # The Flask app is a module-level singleton, so configure it once per session
+    # instead of in every client fixture; tests share one test client (app_client)
+    app_module.app.config["TESTING"] = True
+    app_module.app.config["PASSWORD_HASH_METHOD"] = TEST_PASSWORD_HASH_METHOD
+    return app_module.app
+
+
+@pytest.fixture
+def today():
+    # Read per test, so date arithmetic stays correct for a run that crosses midnight
+    return datetime.date.today()
+
+
+@pytest.fixture(autouse=True)
+def _clear_available_labs_cache():
+    # Each test gets a fresh database, so cached availability must not leak
+    app_module.invalidate_availability()
+    yield
+    app_module.invalidate_availability()
+
+
+# Every table app.init_db() creates; the single schema all test modules clone
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS users (
+    college_id TEXT PRIMARY KEY NOT NULL,
+    name TEXT NOT NULL,
+    email TEXT UNIQUE NOT NULL,
+    password_hash TEXT NOT NULL,
+    role TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS bookings (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    college_id TEXT NOT NULL,
+    lab_name TEXT NOT NULL,
+    booking_date TEXT NOT NULL,
+    start_time TEXT NOT NULL,
+    end_time TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    created_at TEXT NOT NULL,
+    updated_at TEXT,
+    FOREIGN KEY (college_id) REFERENCES users(college_id)
+);
+CREATE TABLE IF NOT EXISTS labs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT UNIQUE NOT NULL,
+    capacity INTEGER NOT NULL,
+    equipment TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS availability_slots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    lab_id INTEGER NOT NULL,
+    day_of_week TEXT NOT NULL,
+    start_time TEXT NOT NULL,
+    end_time TEXT NOT NULL,
+    FOREIGN KEY (lab_id) REFERENCES labs(id) ON DELETE CASCADE
+);
+CREATE TABLE IF NOT EXISTS equipment_availability (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    lab_id INTEGER NOT NULL,
+    equipment_name TEXT NOT NULL,
+    is_available TEXT NOT NULL DEFAULT 'yes',
+    created_at TEXT NOT NULL,
+    updated_at TEXT,
+    FOREIGN KEY (lab_id) REFERENCES labs(id) ON DELETE CASCADE,
+    UNIQUE(lab_id, equipment_name)
+);
+CREATE TABLE IF NOT EXISTS disabled_labs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    lab_id INTEGER NOT NULL,
+    disabled_date TEXT NOT NULL,
+    reason TEXT,
+    created_at TEXT NOT NULL,
+    FOREIGN KEY (lab_id) REFERENCES labs(id) ON DELETE CASCADE
+);
+CREATE TABLE IF NOT EXISTS lab_assistant_assignments (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    lab_id INTEGER NOT NULL,
+    assistant_college_id TEXT NOT NULL,
+    assigned_at TEXT NOT NULL,
+    FOREIGN KEY (lab_id) REFERENCES labs(id) ON DELETE CASCADE,
+    FOREIGN KEY (assistant_college_id) REFERENCES users(college_id)
+);
+-- Same indexes as app.init_db()
+CREATE INDEX IF NOT EXISTS idx_bookings_college ON bookings (college_id);
+CREATE INDEX IF NOT EXISTS idx_bookings_lab_date ON bookings (lab_name, booking_date);
+CREATE INDEX IF NOT EXISTS idx_bookings_status ON bookings (status);
+CREATE INDEX IF NOT EXISTS idx_availability_slots_day_lab
+ON availability_slots (day_of_week, lab_id, start_time, end_time);
+CREATE INDEX IF NOT EXISTS idx_availability_slots_lab_day
+ON availability_slots (lab_id, day_of_week, start_time, end_time);
+"""
+
+
+# :memory: databases already keep their journal in memory; also keep temp b-trees
+# (ORDER BY/DISTINCT spills) in memory and skip syncs if a file URI is ever used.
+TEST_PRAGMAS = """
+PRAGMA temp_store = MEMORY;
+PRAGMA synchronous = OFF;
+"""
+
+
+# Users present in every test database. Tests that only need an authenticated
+# caller use tokens[key] instead of registering and logging in over HTTP.
+SEED_PASSWORD = "SeedPass1!"
+SEED_USERS = {
+    "admin": ("SEED_ADMIN", "Seed Admin", "seed_admin@pesu.edu", "admin"),
+    "student1": ("SEED_STU1", "Seed Student One", "seed_stu1@pesu.edu", "student"),
+    "student2": ("SEED_STU2", "Seed Student Two", "seed_stu2@pesu.edu", "student"),
+    "faculty": ("SEED_FAC", "Seed Faculty", "seed_fac@pesu.edu", "faculty"),
+    "lab_assistant": ("SEED_LA", "Seed Lab Assistant", "seed_la@pesu.edu", "lab_assistant"),
+}
+
+
+@lru_cache(maxsize=None)
+def hash_password(password, method=TEST_PASSWORD_HASH_METHOD):
+    # generate_password_hash is salted, so reuse one hash per password and method
+    return generate_password_hash(password, method=method)
+
+
+@lru_cache(maxsize=None)
+def issue_token(college_id, role, name):
+    # Same payload handle_login() signs, without the /api/login round trip. Cached
+    # per principal: one signature per session, well inside JWT_EXP_DELTA_SECONDS
+    return app_module._generate_token({"college_id": college_id, "role": role, "name": name})
+
+
+def seed_users(conn, users):
+    # Insert (college_id, name, email, role) rows in one executemany instead of one
+    # /api/register round trip each; returns the token /api/login would issue per user
+    users = list(users)
+    password_hash = hash_password(SEED_PASSWORD)
+    conn.executemany(
+        "INSERT INTO users (college_id, name, email, password_hash, role) VALUES (?, ?, ?, ?, ?)",
+        [(college_id, name, email, password_hash, role) for college_id, name, email, role in users],
+    )
+    conn.commit()
+    return {college_id: issue_token(college_id, role, name) for college_id, name, _email, role in users}
+
+
+@pytest.fixture(scope="session")
+def schema_template():
+    # Build the schema once per session; every test gets its own copy via backup()
+    template = sqlite3.connect(":memory:")
+    template.executescript(SCHEMA_SQL)
+    seed_users(template, SEED_USERS.values())
+    yield template
+    template.close()
+
+
+@pytest.fixture(scope="session")
+def tokens():
+    # Minted once per session
+    return {key: issue_token(college_id, role, name) for key, (college_id, name, _email, role) in SEED_USERS.items()}
+
+
+@pytest.fixture(scope="session")
+def auth_headers(tokens):
+    # Prebuilt Authorization headers so tests reuse one dict per role
+    return {key: {"Authorization": f"Bearer {token}"} for key, token in tokens.items()}
+
+
+@pytest.fixture
+def db(schema_template):
+    # The per-test database connection the app sees through get_db_connection().
+    # Private :memory: connections and per-process session fixtures keep
+    # pytest-xdist workers (pytest -n auto) from sharing any database state.
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(TEST_PRAGMAS)
+    schema_template.backup(conn)
+    conn.row_factory = sqlite3.Row
+    yield conn
+    conn.close()
+
+
+@pytest.fixture(scope="session")
+def app_client(testing_app):
+    # One test client for the session. The API is bearer-token only, so without a
+    # cookie jar the client carries no state from one test to the next; handlers
+    # look up get_db_connection() per request, so per-test patches still apply.
+    with testing_app.test_client(use_cookies=False) as client_obj:
+        yield client_obj
+
+
+@pytest.fixture
+def client(monkeypatch, db, app_client):
+    monkeypatch.setattr("app.get_db_connection", lambda: db)
+    monkeypatch.setattr("app.DATABASE", ":memory:")
+    return app_client
+
+
+@pytest.fixture
+def bare_client(app_client):
+    # For requests rejected before any database access (e.g. /api/me auth errors)
+    return app_client
+
+
+@pytest.fixture
+def seed_user(db):
+    # Arrange-step shortcut for a user a test refers to by id
+    def _seed_user(college_id, role="student", name=None):
+        name = name or college_id
+        return seed_users(db, [(college_id, name, f"{college_id.lower()}@seed.pesu.edu", role)])[college_id]
+
+    return _seed_user
@@ -1,137 +1,49 @@
 #!/usr/bin/env python
 """
 Quick validation script to test admin endpoint occupancy metrics.
-Run: pytest test_admin_occupancy.py -v -s
+Run: pytest tests/test_admin_occupancy.py -v
 """
 import pytest
-import datetime
 from datetime import timedelta
-from werkzeug.security import generate_password_hash
-import sqlite3
 
 import app as app_module
+from tests.conftest import CREATED_AT, SEED_USERS
 
+# The seeded student who holds the booking in the occupancy test
+STUDENT_ID = SEED_USERS["student1"][0]
 
-@pytest.fixture
-def client(monkeypatch):
-    """Setup in-memory DB client for testing."""
-    app_module.app.config["TESTING"] = True
-    conn = sqlite3.connect(":memory:")
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-
-    # Create all tables
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS users (
-            college_id TEXT PRIMARY KEY NOT NULL,
-            name TEXT NOT NULL,
-            email TEXT UNIQUE NOT NULL,
-            password_hash TEXT NOT NULL,
-            role TEXT NOT NULL
-        );
-    """)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS labs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT UNIQUE NOT NULL,
-            capacity INTEGER NOT NULL,
-            equipment TEXT NOT NULL,
-            created_at TEXT,
-            updated_at TEXT
-        );
-    """)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS availability_slots (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            lab_id INTEGER NOT NULL,
-            day_of_week TEXT NOT NULL,
-            start_time TEXT NOT NULL,
-            end_time TEXT NOT NULL,
-            FOREIGN KEY (lab_id) REFERENCES labs(id)
-        );
-    """)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS bookings (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            college_id TEXT NOT NULL,
-            lab_name TEXT NOT NULL,
-            booking_date TEXT NOT NULL,
-            start_time TEXT NOT NULL,
-            end_time TEXT NOT NULL,
-            status TEXT NOT NULL DEFAULT 'pending',
-            created_at TEXT NOT NULL,
-            updated_at TEXT,
-            FOREIGN KEY (college_id) REFERENCES users(college_id)
-        );
-    """)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS disabled_labs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            lab_id INTEGER NOT NULL,
-            disabled_date TEXT NOT NULL,
-            reason TEXT,
-            created_at TEXT NOT NULL,
-            FOREIGN KEY (lab_id) REFERENCES labs(id)
-        );
-    """)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS lab_assistant_assignments (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            lab_id INTEGER NOT NULL,
-            assistant_college_id TEXT NOT NULL,
-            assigned_at TEXT NOT NULL,
-            FOREIGN KEY (lab_id) REFERENCES labs(id),
-            FOREIGN KEY (assistant_college_id) REFERENCES users(college_id)
-        );
-    """)
-    conn.commit()
-
-    # Monkeypatch to use in-memory DB
-    monkeypatch.setattr("app.get_db_connection", lambda: conn)
-    monkeypatch.setattr("app.DATABASE", ":memory:")
-
-    with app_module.app.test_client() as test_client:
-        yield test_client
 
-    conn.close()
-
-
-def test_admin_sees_occupancy_metrics(client):
-    """Test that admin endpoint returns occupancy metrics and status badges."""
+@pytest.fixture
+def admin_env(client, tokens, today):
+    """Physics Lab (capacity 10) with 09:00-11:00 and 14:00-16:00 slots tomorrow."""
+    admin_token = tokens["admin"]
     conn = app_module.get_db_connection()
     cursor = conn.cursor()
 
-    # Create test data
-    date_str = (datetime.date.today() + timedelta(days=1)).strftime('%Y-%m-%d')
+    date_str = (today + timedelta(days=1)).strftime('%Y-%m-%d')
     day = app_module.get_day_of_week(date_str)
 
     # Create a lab
     cursor.execute(
-        "INSERT INTO labs (name, capacity, equipment) VALUES (?, ?, ?)",
-        ("Physics Lab", 10, "[\"Microscopes\"]"),
+        "INSERT INTO labs (name, capacity, equipment, created_at) VALUES (?, ?, ?, ?)",
+        ("Physics Lab", 10, "[\"Microscopes\"]", CREATED_AT),
     )
     lab_id = cursor.lastrowid
 
     # Add 2 availability slots
-    cursor.execute(
+    cursor.executemany(
         "INSERT INTO availability_slots (lab_id, day_of_week, start_time, end_time) VALUES (?, ?, ?, ?)",
-        (lab_id, day, "09:00", "11:00"),
-    )
-    cursor.execute(
-        "INSERT INTO availability_slots (lab_id, day_of_week, start_time, end_time) VALUES (?, ?, ?, ?)",
-        (lab_id, day, "14:00", "16:00"),
+        [(lab_id, day, "09:00", "11:00"), (lab_id, day, "14:00", "16:00")],
     )
+    # Tests commit once after adding their own rows
+    return client, admin_token, lab_id, date_str, day
 
-    # Create users
-    cursor.execute(
-        "INSERT INTO users (college_id, name, email, password_hash, role) VALUES (?, ?, ?, ?, ?)",
-        ("S001", "John Doe", "john@college.edu", generate_password_hash("Pass1!234"), "student"),
-    )
-    cursor.execute(
-        "INSERT INTO users (college_id, name, email, password_hash, role) VALUES (?, ?, ?, ?, ?)",
-        ("A001", "Admin", "admin@college.edu", generate_password_hash("Pass1!234"), "admin"),
-    )
-    conn.commit()
+
+def test_admin_sees_occupancy_metrics(admin_env):
+    """Test that admin endpoint returns occupancy metrics and status badges."""
+    client, admin_token, lab_id, date_str, day = admin_env
+    conn = app_module.get_db_connection()
+    cursor = conn.cursor()
 
     # Book one slot
     cursor.execute(
@@ -139,30 +51,23 @@ def test_admin_sees_occupancy_metrics(client):
         "start_time, end_time, status, created_at, updated_at) "
         "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
         (
-            "S001",
+            STUDENT_ID,
             "Physics Lab",
             date_str,
             "09:00",
             "11:00",
             "approved",
-            datetime.datetime.now(datetime.timezone.utc).isoformat(),
-            datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            CREATED_AT,
+            CREATED_AT,
         ),
     )
+    # One commit for the whole arrange step
     conn.commit()
 
-    # Login as admin
-    login_resp = client.post(
-        '/api/login',
-        json={"college_id": "A001", "password": "Pass1!234"}
-    )
-    assert login_resp.status_code == 200
-    token = login_resp.get_json()["token"]
-
     # Get admin view
     resp = client.get(
         f'/api/admin/labs/available?date={date_str}',
-        headers={"Authorization": f"Bearer {token}"}
+        headers={"Authorization": f"Bearer {admin_token}"}
     )
 
     assert resp.status_code == 200
@@ -206,54 +111,24 @@ def test_admin_sees_occupancy_metrics(client):
     assert slot2['available'] == 10
     assert slot2['occupancy_label'] == '10/10 free'
 
-    print("✅ Admin occupancy metrics test PASSED")
 
-
-def test_admin_sees_disabled_lab_status(client):
+def test_admin_sees_disabled_lab_status(admin_env):
     """Test that disabled labs show correct status badge."""
+    client, admin_token, lab_id, date_str, day = admin_env
     conn = app_module.get_db_connection()
     cursor = conn.cursor()
 
-    date_str = (datetime.date.today() + timedelta(days=1)).strftime('%Y-%m-%d')
-    day = app_module.get_day_of_week(date_str)
-
-    # Create a lab
-    cursor.execute(
-        "INSERT INTO labs (name, capacity, equipment) VALUES (?, ?, ?)",
-        ("Chemistry Lab", 15, "[\"Bunsen Burners\"]"),
-    )
-    lab_id = cursor.lastrowid
-
-    # Add availability
-    cursor.execute(
-        "INSERT INTO availability_slots (lab_id, day_of_week, start_time, end_time) VALUES (?, ?, ?, ?)",
-        (lab_id, day, "10:00", "12:00"),
-    )
-
-    # Create admin user
-    cursor.execute(
-        "INSERT INTO users (college_id, name, email, password_hash, role) VALUES (?, ?, ?, ?, ?)",
-        ("A001", "Admin", "admin@college.edu", generate_password_hash("Pass1!234"), "admin"),
-    )
-
     # Disable the lab
     cursor.execute(
         "INSERT INTO disabled_labs (lab_id, disabled_date, reason, created_at) VALUES (?, ?, ?, ?)",
-        (lab_id, date_str, "Maintenance", datetime.datetime.now(datetime.timezone.utc).isoformat()),
+        (lab_id, date_str, "Maintenance", CREATED_AT),
     )
     conn.commit()
 
-    # Login as admin
-    login_resp = client.post(
-        '/api/login',
-        json={"college_id": "A001", "password": "Pass1!234"}
-    )
-    token = login_resp.get_json()["token"]
-
     # Get admin view
     resp = client.get(
         f'/api/admin/labs/available?date={date_str}',
-        headers={"Authorization": f"Bearer {token}"}
+        headers={"Authorization": f"Bearer {admin_token}"}
     )
 
     assert resp.status_code == 200
@@ -265,5 +140,3 @@ def test_admin_sees_disabled_lab_status(client):
     assert lab['status_badge'] in ['🔴', '\U0001F534']  # Red circle emoji
     assert lab['disabled'] is True
     assert lab['disabled_reason'] == 'Maintenance'
-
-    print("✅ Admin disabled lab status test PASSED")
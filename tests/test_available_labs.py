@@ -1,104 +1,17 @@
-import sqlite3
+from datetime import timedelta
+
 import pytest
-import datetime
-from datetime import timezone, timedelta
-from werkzeug.security import generate_password_hash
 
 import app as app_module
+from tests.conftest import CREATED_AT, SEED_USERS, hash_password, seed_users
 
-
-@pytest.fixture
-def client(monkeypatch):
-    app_module.app.config["TESTING"] = True
-    conn = sqlite3.connect(":memory:")
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    # create minimal tables used in these tests
-    cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS users (
-            college_id TEXT PRIMARY KEY NOT NULL,
-            name TEXT NOT NULL,
-            email TEXT UNIQUE NOT NULL,
-            password_hash TEXT NOT NULL,
-            role TEXT NOT NULL
-        );
-        """
-    )
-    cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS bookings (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            college_id TEXT NOT NULL,
-            lab_name TEXT NOT NULL,
-            booking_date TEXT NOT NULL,
-            start_time TEXT NOT NULL,
-            end_time TEXT NOT NULL,
-            status TEXT NOT NULL DEFAULT 'pending',
-            created_at TEXT NOT NULL,
-            updated_at TEXT,
-            FOREIGN KEY (college_id) REFERENCES users(college_id)
-        );
-        """
-    )
-    cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS labs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT UNIQUE NOT NULL,
-            capacity INTEGER NOT NULL,
-            equipment TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            updated_at TEXT
-        );
-        """
-    )
-    cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS availability_slots (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            lab_id INTEGER NOT NULL,
-            day_of_week TEXT NOT NULL,
-            start_time TEXT NOT NULL,
-            end_time TEXT NOT NULL,
-            FOREIGN KEY (lab_id) REFERENCES labs(id) ON DELETE CASCADE
-        );
-        """
-    )
-    cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS disabled_labs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            lab_id INTEGER NOT NULL,
-            disabled_date TEXT NOT NULL,
-            reason TEXT,
-            created_at TEXT NOT NULL
-        );
-        """
-    )
-    cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS lab_assistant_assignments (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            lab_id INTEGER NOT NULL,
-            assistant_college_id TEXT NOT NULL,
-            assigned_at TEXT NOT NULL,
-            FOREIGN KEY (lab_id) REFERENCES labs(id) ON DELETE CASCADE,
-            FOREIGN KEY (assistant_college_id) REFERENCES users(college_id)
-        );
-        """
-    )
-    conn.commit()
-    monkeypatch.setattr("app.get_db_connection", lambda: conn)
-    monkeypatch.setattr("app.DATABASE", ":memory:")
-    with app_module.app.test_client() as client_obj:
-        yield client_obj
-    conn.close()
+# The seeded lab assistant behind auth_headers['lab_assistant']
+LAB_ASSISTANT_ID = SEED_USERS['lab_assistant'][0]
 
 
 def _create_user(conn, college_id, name, email, role, password='Pass1!234'):
     cur = conn.cursor()
-    password_hash = generate_password_hash(password)
+    password_hash = hash_password(password)
     cur.execute(
         "INSERT INTO users (college_id, name, email, password_hash, role) "
         "VALUES (?, ?, ?, ?, ?)",
@@ -109,72 +22,55 @@ def _create_user(conn, college_id, name, email, role, password='Pass1!234'):
 
 def _create_lab(conn, name, capacity=10, equipment='[]'):
     cur = conn.cursor()
-    created_at = datetime.datetime.now(timezone.utc).isoformat()
     cur.execute(
         "INSERT INTO labs (name, capacity, equipment, created_at) "
         "VALUES (?, ?, ?, ?)",
-        (name, capacity, equipment, created_at),
+        (name, capacity, equipment, CREATED_AT),
     )
     conn.commit()
     return cur.lastrowid
 
 
 def _create_availability(conn, lab_id, day_of_week, start_time, end_time):
+    _create_availabilities(conn, [(lab_id, day_of_week, start_time, end_time)])
+
+
+def _create_availabilities(conn, slots):
     cur = conn.cursor()
-    cur.execute(
+    cur.executemany(
         "INSERT INTO availability_slots (lab_id, day_of_week, start_time, end_time) "
         "VALUES (?, ?, ?, ?)",
-        (lab_id, day_of_week, start_time, end_time),
+        slots,
     )
     conn.commit()
 
 
 def _create_booking(conn, college_id, lab_name, booking_date, start_time, end_time, status='approved'):
     cur = conn.cursor()
-    created_at = datetime.datetime.now(timezone.utc).isoformat()
     cur.execute(
         "INSERT INTO bookings (college_id, lab_name, booking_date, start_time, end_time, status, created_at) "
         "VALUES (?, ?, ?, ?, ?, ?, ?)",
-        (college_id, lab_name, booking_date, start_time, end_time, status, created_at),
+        (college_id, lab_name, booking_date, start_time, end_time, status, CREATED_AT),
     )
     conn.commit()
     return cur.lastrowid
 
 
-def test_student_view_valid_date(client):
+def test_student_view_valid_date(client, auth_headers, today):
     conn = app_module.get_db_connection()
     # create a student
     _create_user(conn, 'S1', 'Student One', 's1@u.edu', 'student')
     # create a lab and availability for tomorrow
-    date = (datetime.date.today() + timedelta(days=1)).strftime('%Y-%m-%d')
+    date = (today + timedelta(days=1)).strftime('%Y-%m-%d')
     day = app_module.get_day_of_week(date)
     lab_id = _create_lab(conn, 'Physics', 40, '[]')
     _create_availability(conn, lab_id, day, '09:00', '11:00')
 
-    # login by crafting a token (reuse app._generate_token if available)
-    # simpler: register and login via API endpoints
-    client.post(
-        '/api/register',
-        json={
-            'college_id': 'T1',
-            'name': 'T',
-            'email': 't@u.edu',
-            'password': 'Pass1!234',
-            'role': 'student',
-        },
-    )
-    login = client.post(
-        '/api/login',
-        json={
-            'college_id': 'T1',
-            'password': 'Pass1!234',
-        },
-    )
-    token = login.get_json()['token']
+    headers = auth_headers['student1']
 
     resp = client.get(
         f'/api/labs/available?date={date}',
-        headers={'Authorization': f'Bearer {token}'},
+        headers=headers,
     )
     assert resp.status_code == 200
     data = resp.get_json()
@@ -182,37 +78,25 @@ def test_student_view_valid_date(client):
     assert any(lab['lab_name'] == 'Physics' for lab in data['labs'])
 
 
-def test_reject_past_date(client):
-    client.post(
-        '/api/register',
-        json={
-            'college_id': 'P1',
-            'name': 'P',
-            'email': 'p@u.edu',
-            'password': 'Pass1!234',
-            'role': 'student',
-        },
-    )
-    login = client.post(
-        '/api/login',
-        json={
-            'college_id': 'P1',
-            'password': 'Pass1!234',
-        },
-    )
-    token = login.get_json()['token']
-    yesterday = (datetime.date.today() - timedelta(days=1)).strftime('%Y-%m-%d')
+def test_reject_past_date(client, auth_headers, today):
+    headers = auth_headers['student1']
+    yesterday = (today - timedelta(days=1)).strftime('%Y-%m-%d')
     r = client.get(
         f'/api/labs/available?date={yesterday}',
-        headers={'Authorization': f'Bearer {token}'},
+        headers=headers,
     )
     assert r.status_code == 400
 
 
-def test_lab_with_full_bookings(client):
+@pytest.mark.parametrize('date_str', ['2025-+1-01', '2025-1-011', ' 2025-01-1', '2025/01/01'])
+def test_get_day_of_week_rejects_malformed_dates(date_str):
+    assert app_module.get_day_of_week(date_str) is None
+
+
+def test_lab_with_full_bookings(client, auth_headers, today):
     conn = app_module.get_db_connection()
     _create_user(conn, 'S2', 'Stu2', 's2@u.edu', 'student')
-    date = (datetime.date.today() + timedelta(days=2)).strftime('%Y-%m-%d')
+    date = (today + timedelta(days=2)).strftime('%Y-%m-%d')
     day = app_module.get_day_of_week(date)
     lab_id = _create_lab(conn, 'Chemistry', 1, '[]')
     # Delete automatically created slots first
@@ -223,28 +107,11 @@ def test_lab_with_full_bookings(client):
     # create booking that overlaps
     _create_booking(conn, 'S2', 'Chemistry', date, '09:30', '10:30', status='approved')
 
-    client.post(
-        '/api/register',
-        json={
-            'college_id': 'A2',
-            'name': 'A2',
-            'email': 'a2@u.edu',
-            'password': 'Pass1!234',
-            'role': 'student',
-        },
-    )
-    login = client.post(
-        '/api/login',
-        json={
-            'college_id': 'A2',
-            'password': 'Pass1!234',
-        },
-    )
-    token = login.get_json()['token']
+    headers = auth_headers['student1']
 
     resp = client.get(
         f'/api/labs/available?date={date}',
-        headers={'Authorization': f'Bearer {token}'},
+        headers=headers,
     )
     assert resp.status_code == 200
     data = resp.get_json()
@@ -256,34 +123,21 @@ def test_lab_with_full_bookings(client):
     assert chemistry_lab.get('occupancy', {}).get('free', 1) == 0, "Lab should show 0 free slots"
 
 
-def test_admin_view_and_override_and_disable(client):
+def test_admin_view_and_override_and_disable(client, today):
     conn = app_module.get_db_connection()
     # create admin and student
-    _create_user(conn, 'ADM1', 'Admin', 'adm@u.edu', 'admin')
-    _create_user(conn, 'ST1', 'Student', 'st@u.edu', 'student')
+    seeded = seed_users(conn, [
+        ('ADM1', 'Admin', 'adm@u.edu', 'admin'),
+        ('ST1', 'Student', 'st@u.edu', 'student'),
+    ])
 
-    date = (datetime.date.today() + timedelta(days=3)).strftime('%Y-%m-%d')
+    date = (today + timedelta(days=3)).strftime('%Y-%m-%d')
     day = app_module.get_day_of_week(date)
     lab_id = _create_lab(conn, 'Biology', 25, '[]')
     _create_availability(conn, lab_id, day, '10:00', '12:00')
     booking_id = _create_booking(conn, 'ST1', 'Biology', date, '10:00', '11:00', status='approved')
 
-    # admin login
-    client.post(
-        '/api/register',
-        json={
-            'college_id': 'ADMREG',
-            'name': 'ADMREG',
-            'email': 'admreg@u.edu',
-            'password': 'Pass1!234',
-            'role': 'admin',
-        },
-    )
-    login = client.post(
-        '/api/login',
-        json={'college_id': 'ADMREG', 'password': 'Pass1!234'},
-    )
-    admin_token = login.get_json()['token']
+    admin_token = seeded['ADM1']
 
     # view admin labs
     r = client.get(
@@ -323,21 +177,7 @@ def test_admin_view_and_override_and_disable(client):
     assert r4.status_code == 200
 
     # student view should not include the disabled lab
-    client.post(
-        '/api/register',
-        json={
-            'college_id': 'STREG',
-            'name': 'STREG',
-            'email': 'streg@u.edu',
-            'password': 'Pass1!234',
-            'role': 'student',
-        },
-    )
-    login2 = client.post(
-        '/api/login',
-        json={'college_id': 'STREG', 'password': 'Pass1!234'},
-    )
-    token2 = login2.get_json()['token']
+    token2 = seeded['ST1']
     rs = client.get(
         f'/api/labs/available?date={date}',
         headers={'Authorization': f'Bearer {token2}'},
@@ -346,77 +186,50 @@ def test_admin_view_and_override_and_disable(client):
     assert not any(lab['lab_name'] == 'Biology' for lab in rs.get_json()['labs'])
 
 
-def test_admin_endpoint_requires_admin_role(client):
-    # register as student and try to access admin endpoint
-    client.post(
-        '/api/register',
-        json={
-            'college_id': 'N1',
-            'name': 'N',
-            'email': 'n@u.edu',
-            'password': 'Pass1!234',
-            'role': 'student',
-        },
-    )
-    login = client.post(
-        '/api/login',
-        json={'college_id': 'N1', 'password': 'Pass1!234'},
-    )
-    token = login.get_json()['token']
-    date = (datetime.date.today() + timedelta(days=4)).strftime('%Y-%m-%d')
+def test_admin_endpoint_requires_admin_role(client, auth_headers, today):
+    # a student tries to access the admin endpoint
+    headers = auth_headers['student1']
+    date = (today + timedelta(days=4)).strftime('%Y-%m-%d')
     r = client.get(
         f'/api/admin/labs/available?date={date}',
-        headers={'Authorization': f'Bearer {token}'},
+        headers=headers,
     )
     assert r.status_code == 403
 
 
-def test_lab_assistant_view_assigned_labs(client):
+def test_lab_assistant_view_assigned_labs(client, auth_headers, today):
     """Lab assistant should only see labs assigned to them."""
     conn = app_module.get_db_connection()
 
     # Create two labs
-    date_str = datetime.date.today().strftime('%Y-%m-%d')
+    date_str = today.strftime('%Y-%m-%d')
     day = app_module.get_day_of_week(date_str)
     lab1_id = _create_lab(conn, 'Physics', 40, '["Telescope", "Prism"]')
     lab2_id = _create_lab(conn, 'Chemistry', 30, '["Bunsen Burner"]')
 
     # Create availability slots
-    _create_availability(conn, lab1_id, day, '09:00', '11:00')
-    _create_availability(conn, lab2_id, day, '14:00', '16:00')
-
-    # Register and login as lab assistant first
-    client.post(
-        '/api/register',
-        json={
-            'college_id': 'LA1',
-            'name': 'Lab Assist One',
-            'email': 'la1@u.edu',
-            'password': 'Pass1!234',
-            'role': 'lab_assistant',
-        },
-    )
-    login_r = client.post(
-        '/api/login',
-        json={'college_id': 'LA1', 'password': 'Pass1!234'},
-    )
-    token = login_r.get_json()['token']
+    _create_availabilities(conn, [
+        (lab1_id, day, '09:00', '11:00'),
+        (lab2_id, day, '14:00', '16:00'),
+    ])
+
+    # Call as the seeded lab assistant
+    headers = auth_headers['lab_assistant']
 
     # Now assign only lab1 to the assistant (after user exists)
     cur = conn.cursor()
-    created_at = datetime.datetime.now(timezone.utc).isoformat()
     cur.execute(
         "INSERT INTO lab_assistant_assignments"
         " (lab_id, assistant_college_id, assigned_at)"
         " VALUES (?, ?, ?)",
-        (lab1_id, 'LA1', created_at),
+        (lab1_id, LAB_ASSISTANT_ID, CREATED_AT),
     )
     conn.commit()
 
     # Fetch assigned labs
     r = client.get(
         f'/api/lab-assistant/labs/assigned?date={date_str}',
-        headers={'Authorization': f'Bearer {token}'},
+        headers=headers,
     )
     assert r.status_code == 200
     data = r.get_json()
@@ -425,7 +238,7 @@ def test_lab_assistant_view_assigned_labs(client):
     assert data['assigned_labs'][0]['lab_name'] == 'Physics'
 
 
-def test_lab_assistant_sees_all_slots(client):
+def test_lab_assistant_sees_all_slots(client, auth_headers, today):
     """Lab assistant should see both free and booked slots for their labs."""
     conn = app_module.get_db_connection()
 
@@ -433,7 +246,7 @@ def test_lab_assistant_sees_all_slots(client):
     _create_user(conn, 'S2', 'Student Two', 's2@u.edu', 'student')
 
     # Create a lab with availability
-    date_str = datetime.date.today().strftime('%Y-%m-%d')
+    date_str = today.strftime('%Y-%m-%d')
     day = app_module.get_day_of_week(date_str)
     lab_id = _create_lab(conn, 'Biology', 25, '["Microscope"]')
     _create_availability(conn, lab_id, day, '09:00', '17:00')
@@ -441,38 +254,23 @@ def test_lab_assistant_sees_all_slots(client):
     # Create a booking
     _create_booking(conn, 'S2', 'Biology', date_str, '10:00', '12:00', 'approved')
 
-    # Register and login as lab assistant
-    client.post(
-        '/api/register',
-        json={
-            'college_id': 'LA2',
-            'name': 'Lab Assist Two',
-            'email': 'la2@u.edu',
-            'password': 'Pass1!234',
-            'role': 'lab_assistant',
-        },
-    )
-    login_r = client.post(
-        '/api/login',
-        json={'college_id': 'LA2', 'password': 'Pass1!234'},
-    )
-    token = login_r.get_json()['token']
+    # Call as the seeded lab assistant
+    headers = auth_headers['lab_assistant']
 
     # Assign lab to assistant
     cur = conn.cursor()
-    created_at = datetime.datetime.now(timezone.utc).isoformat()
     cur.execute(
         "INSERT INTO lab_assistant_assignments"
         " (lab_id, assistant_college_id, assigned_at)"
         " VALUES (?, ?, ?)",
-        (lab_id, 'LA2', created_at),
+        (lab_id, LAB_ASSISTANT_ID, CREATED_AT),
     )
     conn.commit()
 
     # Fetch assigned labs
     r = client.get(
         f'/api/lab-assistant/labs/assigned?date={date_str}',
-        headers={'Authorization': f'Bearer {token}'},
+        headers=headers,
     )
     assert r.status_code == 200
     data = r.get_json()
@@ -485,48 +283,33 @@ def test_lab_assistant_sees_all_slots(client):
     assert lab['bookings'][0]['college_id'] == 'S2'
 
 
-def test_lab_assistant_default_to_today(client):
+def test_lab_assistant_default_to_today(client, auth_headers, today):
     """If no date provided, lab assistant should get today's assigned labs."""
     conn = app_module.get_db_connection()
 
     # Create a lab
-    date_str = datetime.date.today().strftime('%Y-%m-%d')
+    date_str = today.strftime('%Y-%m-%d')
     day = app_module.get_day_of_week(date_str)
     lab_id = _create_lab(conn, 'Biotechnology', 35, '["Centrifuge"]')
     _create_availability(conn, lab_id, day, '08:00', '18:00')
 
-    # Register and login
-    client.post(
-        '/api/register',
-        json={
-            'college_id': 'LA3',
-            'name': 'Lab Assist Three',
-            'email': 'la3@u.edu',
-            'password': 'Pass1!234',
-            'role': 'lab_assistant',
-        },
-    )
-    login_r = client.post(
-        '/api/login',
-        json={'college_id': 'LA3', 'password': 'Pass1!234'},
-    )
-    token = login_r.get_json()['token']
+    # Call as the seeded lab assistant
+    headers = auth_headers['lab_assistant']
 
     # Assign lab
     cur = conn.cursor()
-    created_at = datetime.datetime.now(timezone.utc).isoformat()
     cur.execute(
         "INSERT INTO lab_assistant_assignments"
         " (lab_id, assistant_college_id, assigned_at)"
         " VALUES (?, ?, ?)",
-        (lab_id, 'LA3', created_at),
+        (lab_id, LAB_ASSISTANT_ID, CREATED_AT),
     )
     conn.commit()
 
     # Fetch without date parameter (should default to today)
     r = client.get(
         '/api/lab-assistant/labs/assigned',
-        headers={'Authorization': f'Bearer {token}'},
+        headers=headers,
     )
     assert r.status_code == 200
     data = r.get_json()
@@ -534,35 +317,21 @@ def test_lab_assistant_default_to_today(client):
     assert len(data['assigned_labs']) == 1
 
 
-def test_lab_assistant_endpoint_requires_role(client):
+def test_lab_assistant_endpoint_requires_role(client, auth_headers, today):
     """Only lab assistants should access the lab assistant endpoint."""
-    # Register and login as student
-    client.post(
-        '/api/register',
-        json={
-            'college_id': 'S3',
-            'name': 'Student Three',
-            'email': 's3@u.edu',
-            'password': 'Pass1!234',
-            'role': 'student',
-        },
-    )
-    login_r = client.post(
-        '/api/login',
-        json={'college_id': 'S3', 'password': 'Pass1!234'},
-    )
-    token = login_r.get_json()['token']
+    # Call as a student
+    headers = auth_headers['student1']
 
     # Try to access lab assistant endpoint
-    date_str = datetime.date.today().strftime('%Y-%m-%d')
+    date_str = today.strftime('%Y-%m-%d')
     r = client.get(
         f'/api/lab-assistant/labs/assigned?date={date_str}',
-        headers={'Authorization': f'Bearer {token}'},
+        headers=headers,
     )
     assert r.status_code == 403
 
 
-def test_student_cannot_see_booked_slots(client):
+def test_student_cannot_see_booked_slots(client, auth_headers, today):
     """Students should not see booked slots (privacy)."""
     conn = app_module.get_db_connection()
 
@@ -570,7 +339,7 @@ def test_student_cannot_see_booked_slots(client):
     _create_user(conn, 'S5', 'Student Five', 's5@u.edu', 'student')
 
     # Create a lab with availability
-    date_str = (datetime.date.today() + timedelta(days=1)).strftime('%Y-%m-%d')
+    date_str = (today + timedelta(days=1)).strftime('%Y-%m-%d')
     day = app_module.get_day_of_week(date_str)
     lab_id = _create_lab(conn, 'Physics Lab', 20, '[]')
     _create_availability(conn, lab_id, day, '09:00', '17:00')
@@ -578,27 +347,13 @@ def test_student_cannot_see_booked_slots(client):
     # Create bookings for some slots
     _create_booking(conn, 'S5', 'Physics Lab', date_str, '10:00', '12:00', 'approved')
 
-    # Register and login as student S4
-    client.post(
-        '/api/register',
-        json={
-            'college_id': 'S4',
-            'name': 'Student Four',
-            'email': 's4@u.edu',
-            'password': 'Pass1!234',
-            'role': 'student',
-        },
-    )
-    login_r = client.post(
-        '/api/login',
-        json={'college_id': 'S4', 'password': 'Pass1!234'},
-    )
-    token = login_r.get_json()['token']
+    # Call as a student other than S5
+    headers = auth_headers['student1']
 
     # Fetch available labs
     r = client.get(
         f'/api/labs/available?date={date_str}',
-        headers={'Authorization': f'Bearer {token}'},
+        headers=headers,
     )
     assert r.status_code == 200
     data = r.get_json()
@@ -610,49 +365,36 @@ def test_student_cannot_see_booked_slots(client):
         assert 'bookings' not in lab or not lab.get('bookings')
 
 
-def test_admin_sees_all_labs_including_disabled(client):
+def test_admin_sees_all_labs_including_disabled(client, auth_headers, today):
     """Admins should see all labs, even disabled ones."""
     conn = app_module.get_db_connection()
 
     # Create labs
-    date_str = (datetime.date.today() + timedelta(days=2)).strftime('%Y-%m-%d')
+    date_str = (today + timedelta(days=2)).strftime('%Y-%m-%d')
     day = app_module.get_day_of_week(date_str)
     lab1_id = _create_lab(conn, 'Lab A', 15, '[]')
     lab2_id = _create_lab(conn, 'Lab B', 20, '[]')
-    _create_availability(conn, lab1_id, day, '09:00', '11:00')
-    _create_availability(conn, lab2_id, day, '09:00', '11:00')
-
-    # Register and login as admin
-    client.post(
-        '/api/register',
-        json={
-            'college_id': 'A1',
-            'name': 'Admin One',
-            'email': 'a1@u.edu',
-            'password': 'Pass1!234',
-            'role': 'admin',
-        },
-    )
-    login_r = client.post(
-        '/api/login',
-        json={'college_id': 'A1', 'password': 'Pass1!234'},
-    )
-    token = login_r.get_json()['token']
+    _create_availabilities(conn, [
+        (lab1_id, day, '09:00', '11:00'),
+        (lab2_id, day, '09:00', '11:00'),
+    ])
+
+    # Call as admin
+    headers = auth_headers['admin']
 
     # Disable lab1
     cur = conn.cursor()
-    created_at = datetime.datetime.now(timezone.utc).isoformat()
     cur.execute(
         "INSERT INTO disabled_labs (lab_id, disabled_date, reason, created_at)"
         " VALUES (?, ?, ?, ?)",
-        (lab1_id, date_str, 'Maintenance', created_at),
+        (lab1_id, date_str, 'Maintenance', CREATED_AT),
     )
     conn.commit()
 
     # Admin should see both labs (including disabled one)
     r = client.get(
         f'/api/admin/labs/available?date={date_str}',
-        headers={'Authorization': f'Bearer {token}'},
+        headers=headers,
     )
     assert r.status_code == 200
     data = r.get_json()
@@ -663,3 +405,83 @@ def test_admin_sees_all_labs_including_disabled(client):
     )
     assert disabled_lab
     assert disabled_lab['disabled'] is True
+
+
+@pytest.fixture
+def available_labs_cache(monkeypatch):
+    # The response cache is opt-in; enable it for the tests that exercise it
+    monkeypatch.setattr(app_module, "AVAILABLE_LABS_CACHE_TTL", 30)
+
+
+def test_available_labs_not_cached_by_default(client, auth_headers, today):
+    date = (today + timedelta(days=1)).strftime('%Y-%m-%d')
+    r = client.get(f'/api/labs/available?date={date}', headers=auth_headers['student1'])
+    assert r.status_code == 200
+    assert app_module._available_labs_cache == {}
+
+
+def test_available_labs_response_cached_until_invalidated(client, auth_headers, today, available_labs_cache):
+    conn = app_module.get_db_connection()
+    date = (today + timedelta(days=1)).strftime('%Y-%m-%d')
+    day = app_module.get_day_of_week(date)
+    lab_id = _create_lab(conn, 'Physics', 40, '[]')
+    _create_availability(conn, lab_id, day, '09:00', '11:00')
+
+    headers = auth_headers['student1']
+
+    first = client.get(f'/api/labs/available?date={date}', headers=headers)
+    assert first.status_code == 200
+    assert first.get_json()['total_labs'] == 1
+
+    # A direct DB write bypasses the handlers, so the cached body is served
+    chem_id = _create_lab(conn, 'Chemistry', 20, '[]')
+    _create_availability(conn, chem_id, day, '09:00', '11:00')
+    cached = client.get(f'/api/labs/available?date={date}', headers=headers)
+    assert cached.get_data() == first.get_data()
+
+    app_module.invalidate_availability()
+    fresh = client.get(f'/api/labs/available?date={date}', headers=headers)
+    assert fresh.status_code == 200
+    assert fresh.get_json()['total_labs'] == 2
+
+
+# Each write endpoint that can change /api/labs/available, called with an admin header
+AVAILABILITY_WRITES = {
+    "approve_booking": lambda c, h, ids: c.post(f"/api/bookings/{ids['pending']}/approve", headers=h),
+    "reject_booking": lambda c, h, ids: c.post(f"/api/bookings/{ids['pending']}/reject", headers=h),
+    "override_booking": lambda c, h, ids: c.post(f"/api/admin/bookings/{ids['approved']}/override", headers=h),
+    "create_lab": lambda c, h, ids: c.post(
+        "/api/labs", json={"name": "Chemistry", "capacity": 20, "equipment": ["Burette"]}, headers=h
+    ),
+    "update_lab": lambda c, h, ids: c.put(
+        f"/api/labs/{ids['lab']}", json={"name": "Physics", "capacity": 30, "equipment": ["Prism"]}, headers=h
+    ),
+    "delete_lab": lambda c, h, ids: c.delete(f"/api/labs/{ids['lab']}", headers=h),
+    "disable_lab": lambda c, h, ids: c.post(
+        f"/api/admin/labs/{ids['lab']}/disable", json={"date": ids['date']}, headers=h
+    ),
+}
+
+
+@pytest.mark.parametrize("write", AVAILABILITY_WRITES.values(), ids=AVAILABILITY_WRITES.keys())
+def test_availability_writes_invalidate_cache(client, auth_headers, today, available_labs_cache, write):
+    conn = app_module.get_db_connection()
+    date = (today + timedelta(days=1)).strftime('%Y-%m-%d')
+    day = app_module.get_day_of_week(date)
+    lab_id = _create_lab(conn, 'Physics', 40, '["Prism"]')
+    _create_availability(conn, lab_id, day, '09:00', '11:00')
+    student_id = SEED_USERS['student1'][0]
+    ids = {
+        'lab': lab_id,
+        'date': date,
+        'pending': _create_booking(conn, student_id, 'Physics', date, '09:00', '10:00', status='pending'),
+        'approved': _create_booking(conn, student_id, 'Physics', date, '10:00', '11:00'),
+    }
+
+    r = client.get(f'/api/labs/available?date={date}', headers=auth_headers['student1'])
+    assert r.status_code == 200
+    assert app_module._available_labs_cache
+
+    r = write(client, auth_headers['admin'], ids)
+    assert r.status_code in (200, 201), r.get_json()
+    assert app_module._available_labs_cache == {}
@@ -1,6 +1,5 @@
 import sqlite3
-import pytest
-from app import app, _generate_token
+from app import _generate_token
 
 
 def raise_sqlite_error():
@@ -14,85 +13,6 @@ def raise_sqlite_error():
     return FakeConn()
 
 
-@pytest.fixture
-def client(monkeypatch):
-    app.config["TESTING"] = True
-    conn = sqlite3.connect(":memory:")
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS users (
-            college_id TEXT PRIMARY KEY NOT NULL,
-            name TEXT NOT NULL,
-            email TEXT UNIQUE NOT NULL,
-            password_hash TEXT NOT NULL,
-            role TEXT NOT NULL
-        );
-        """
-    )
-    cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS bookings (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            college_id TEXT NOT NULL,
-            lab_name TEXT NOT NULL,
-            booking_date TEXT NOT NULL,
-            start_time TEXT NOT NULL,
-            end_time TEXT NOT NULL,
-            status TEXT NOT NULL DEFAULT 'pending',
-            created_at TEXT NOT NULL,
-            updated_at TEXT,
-            FOREIGN KEY (college_id) REFERENCES users(college_id)
-        );
-        """
-    )
-    cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS labs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT UNIQUE NOT NULL,
-            capacity INTEGER NOT NULL,
-            equipment TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            updated_at TEXT
-        );
-        """
-    )
-    cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS availability_slots (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            lab_id INTEGER NOT NULL,
-            day_of_week TEXT NOT NULL,
-            start_time TEXT NOT NULL,
-            end_time TEXT NOT NULL,
-            FOREIGN KEY (lab_id) REFERENCES labs(id) ON DELETE CASCADE
-        );
-        """
-    )
-    cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS equipment_availability (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            lab_id INTEGER NOT NULL,
-            equipment_name TEXT NOT NULL,
-            is_available TEXT NOT NULL DEFAULT 'yes',
-            created_at TEXT NOT NULL,
-            updated_at TEXT,
-            FOREIGN KEY (lab_id) REFERENCES labs(id) ON DELETE CASCADE,
-            UNIQUE(lab_id, equipment_name)
-        );
-        """
-    )
-    conn.commit()
-    monkeypatch.setattr("app.get_db_connection", lambda: conn)
-    monkeypatch.setattr("app.DATABASE", ":memory:")
-    with app.test_client() as client_obj:
-        yield client_obj
-    conn.close()
-
-
 def test_create_booking_db_error(client, monkeypatch):
     # Force DB connection to raise sqlite error to hit exception branch
     monkeypatch.setattr("app.get_db_connection", raise_sqlite_error)
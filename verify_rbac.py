@@ -8,6 +8,8 @@ import requests
 import json
 
 BASE_URL = "http://localhost:5000"
+# One keep-alive session so every check reuses the same pooled connection
+session = requests.Session()
 
 def print_test(name, passed, details=""):
     """Print test result."""
@@ -19,7 +21,7 @@ def print_test(name, passed, details=""):
 
 def register_user(college_id, name, email, password, role):
     """Register a new user."""
-    response = requests.post(
+    response = session.post(
         f"{BASE_URL}/api/register",
         json={
             "college_id": college_id,
@@ -33,7 +35,7 @@ def register_user(college_id, name, email, password, role):
 
 def login_user(college_id, password):
     """Login and get token."""
-    response = requests.post(
+    response = session.post(
         f"{BASE_URL}/api/login",
         json={"college_id": college_id, "password": password}
     )
@@ -43,7 +45,7 @@ def login_user(college_id, password):
 
 def create_booking(token, lab_name="Test Lab", date="2024-12-25", start="10:00", end="12:00"):
     """Create a booking request."""
-    response = requests.post(
+    response = session.post(
         f"{BASE_URL}/api/bookings",
         headers={"Authorization": f"Bearer {token}"},
         json={
@@ -102,7 +104,7 @@ def main():
     
     # Test 4: Student tries to access admin endpoint (should fail)
     print("Test 4: Testing role-based access restrictions...")
-    response = requests.get(
+    response = session.get(
         f"{BASE_URL}/api/bookings/pending",
         headers={"Authorization": f"Bearer {student_token}"}
     )
@@ -114,7 +116,7 @@ def main():
     )
     
     # Test 5: Student tries to approve booking (should fail)
-    response = requests.post(
+    response = session.post(
         f"{BASE_URL}/api/bookings/{booking_id}/approve",
         headers={"Authorization": f"Bearer {student_token}"}
     )
@@ -126,7 +128,7 @@ def main():
     )
     
     # Test 6: Lab Assistant tries to access admin endpoint (should fail)
-    response = requests.get(
+    response = session.get(
         f"{BASE_URL}/api/bookings/pending",
         headers={"Authorization": f"Bearer {lab_token}"}
     )
@@ -138,7 +140,7 @@ def main():
     )
     
     # Test 7: Admin can access admin endpoint (should succeed)
-    response = requests.get(
+    response = session.get(
         f"{BASE_URL}/api/bookings/pending",
         headers={"Authorization": f"Bearer {admin_token}"}
     )
@@ -151,7 +153,7 @@ def main():
     )
     
     # Test 8: Admin can approve booking (should succeed)
-    response = requests.post(
+    response = session.post(
         f"{BASE_URL}/api/bookings/{booking_id}/approve",
         headers={"Authorization": f"Bearer {admin_token}"}
     )
@@ -163,7 +165,7 @@ def main():
     )
     
     # Test 9: Unauthenticated access (should fail)
-    response = requests.get(f"{BASE_URL}/api/bookings")
+    response = session.get(f"{BASE_URL}/api/bookings")
     unauth_blocked = response.status_code == 401
     print_test(
         "Unauthenticated Access Blocked",
@@ -172,7 +174,7 @@ def main():
     )
     
     # Test 10: Student can view own bookings
-    response = requests.get(
+    response = session.get(
         f"{BASE_URL}/api/bookings",
         headers={"Authorization": f"Bearer {student_token}"}
     )
@@ -189,7 +191,7 @@ def main():
     )
     
     # Test 11: Admin can view all bookings
-    response = requests.get(
+    response = session.get(
         f"{BASE_URL}/api/bookings",
         headers={"Authorization": f"Bearer {admin_token}"}
     )